@@ -2,18 +2,22 @@
 
 import asyncio
 import datetime
+import functools
 import logging
 import os
+import random
 from typing import Optional, Tuple
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 
 import homeassistant.helpers.config_validation as cv
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.event import async_call_later
-from homeassistant.const import CONF_API_KEY, CONF_DEVICE
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.const import CONF_API_KEY, CONF_DEVICE, \
+    EVENT_HOMEASSISTANT_STOP
 
 from .client import HeartbeatClient, HeartbeatClientConnectError, \
     HeartbeatClientAuthError
@@ -30,6 +34,12 @@ HEARTBEAT_URL = os.getenv(
 HEARTBEAT_SERVICE = 'hausnet_heartbeat'
 # Number of times to retry sending the heartbeat
 HEARTBEAT_RETRY_TIMES = 3
+# Backoff between retries, in seconds. The delay before retry N is drawn
+# uniformly from [base, 2*base), with base doubling from the initial
+# value each retry, capped at the maximum -- so transient service
+# failures are not hammered with back-to-back requests.
+HEARTBEAT_INITIAL_BACKOFF = 1.0
+HEARTBEAT_MAX_BACKOFF = 30.0
 
 ##
 # Config looks as follows:
@@ -46,11 +56,23 @@ CONFIG_SCHEMA = vol.Schema({
     extra=vol.ALLOW_EXTRA,
 )
 
-# The default hausnet_heartbeat period,
-# in seconds. Can be overridden for testing
-# purposes. Note that the service may reject too high a rate of resets. 15
-# minutes is considered adequate.
-HEARTBEAT_PERIOD_SECONDS = int(os.getenv('HEARTBEAT_PERIOD', str(15*60)))
+@functools.cache
+def heartbeat_period_seconds() -> int:
+    """ The hausnet_heartbeat period, in seconds. Read from the
+        HEARTBEAT_PERIOD environment variable on first use rather than at
+        import, so tests can override it, with a default of 15 minutes --
+        the service may reject too high a rate of resets. Clamped to a
+        floor of one minute: a zero or negative period would turn the
+        beat timer into a busy loop.
+    """
+    configured = int(os.getenv('HEARTBEAT_PERIOD', str(15*60)))
+    if configured < 60:
+        LOGGER.warning(
+            "HEARTBEAT_PERIOD of %d seconds is too short; using 60 seconds",
+            configured
+        )
+        return 60
+    return configured
 
 
 class DeviceNotFoundError(Exception):
@@ -64,36 +86,45 @@ async def async_setup_entry(hass: HomeAssistant, config: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     token = config.data[CONF_API_KEY]
     device = config.data[CONF_DEVICE]
-    failures = {
-        HeartbeatService.CONNECT_FAILED:
-            f"Network connection to {HEARTBEAT_URL} failed.",
-        HeartbeatService.DEVICE_NOT_FOUND:
-            f"Device {device} not found at service",
-        HeartbeatService.AUTH_FAILED:
-            "Authentication token invalid",
-        HeartbeatService.UNKNOWN_FAILURE:
-            "Unknown connection or authentication failure ",
-    }
     try:
         success, error = await HeartbeatService.verify_connection(
             hass, HEARTBEAT_URL, token, device
         )
         if not success:
-            raise ConfigEntryAuthFailed(failures[error])
+            raise ConfigEntryAuthFailed(
+                _FAILURE_TEMPLATES[error].format(
+                    url=HEARTBEAT_URL, device=device
+                )
+            )
     except Exception as exception:
         raise ConfigEntryAuthFailed(exception) from exception
     service = HeartbeatService(
-        hass, config.data[CONF_API_KEY], config.data[CONF_DEVICE]
+        hass, config, config.data[CONF_API_KEY], config.data[CONF_DEVICE]
     )
     await service.init_api_client()
+    # Setup already runs on the event loop, so the first beat can be
+    # scheduled directly instead of through the cross-thread handoff of
+    # run_coroutine_threadsafe. Started eagerly: the beat runs up to its
+    # first await without a trip through the scheduler queue.
+    hass.async_create_task(service.beat_heart(), eager_start=True)
     hass.data[DOMAIN][HEARTBEAT_SERVICE] = service
     LOGGER.debug(
         "Created the Heartbeat notification service: url=%s; device=%s",
-        HEARTBEAT_URL, hass.data[DOMAIN].get(CONF_DEVICE)
+        HEARTBEAT_URL, device
     )
     return True
 
 
+async def async_unload_entry(hass: HomeAssistant, config: ConfigEntry) -> bool:
+    """Unload the Heartbeat component, cancelling the pending beat timer
+    so no orphaned timer chain keeps firing after the entry is removed.
+    """
+    service = hass.data[DOMAIN].pop(HEARTBEAT_SERVICE, None)
+    if service:
+        service.async_stop()
+    return True
+
+
 class HeartbeatService:
     """Implements a heart-beat via the Heartbeat monitor service. """
 
@@ -103,39 +134,73 @@ class HeartbeatService:
     DEVICE_NOT_FOUND = 2
     UNKNOWN_FAILURE = 3
 
-    def __init__(self, hass: HomeAssistant, api_key: str, device: str) -> None:
+    def __init__(
+            self,
+            hass: HomeAssistant,
+            entry: ConfigEntry,
+            api_key: str,
+            device: str
+    ) -> None:
         """Set up the service"""
         self._hass: HomeAssistant = hass
+        self._entry: ConfigEntry = entry
         self._api_url: str = HEARTBEAT_URL
         self._api_token: str = api_key
         self._device_name: str = device
         self._api_client: Optional[HeartbeatClient] = None
-        asyncio.run_coroutine_threadsafe(self.beat_heart(), hass.loop)
+        # Cached id of the device's heartbeat at the service. Looked up on
+        # the first beat and reused thereafter, so steady-state beats are a
+        # single request instead of a lookup + send pair.
+        self._heartbeat_id: Optional[int] = None
+        # Guards against a second beat starting while a slow send (e.g. a
+        # request hanging near the socket timeout) is still in flight.
+        self._busy = asyncio.Lock()
+        # One long-lived interval timer instead of a fresh one-shot per
+        # beat; cancelled on shutdown so a beat queued at shutdown doesn't
+        # fire a blocking HTTP call after teardown.
+        self._cancel_timer = async_track_time_interval(
+            hass,
+            self.beat_heart,
+            datetime.timedelta(seconds=heartbeat_period_seconds())
+        )
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    @callback
+    def async_stop(self) -> None:
+        """ Cancel the pending beat timer and drop the client. """
+        if self._cancel_timer:
+            self._cancel_timer()
+            self._cancel_timer = None
+        self._api_client = None
+        LOGGER.debug("Heartbeat timer cancelled")
+
+    # noinspection PyUnusedLocal
+    # (for event - unused)
+    async def _async_stop(self, event) -> None:
+        """ Cancel the pending beat timer on HASS shutdown. """
+        self.async_stop()
 
     # noinspection PyUnusedLocal
     # (for arg - unused)
     async def beat_heart(self, arg: Optional[datetime.datetime] = None) -> None:
-        """ Called by timer (or at object construction time, once) to beat the
-        heart at the service. Sets up the call for the next beat at the end.
+        """ Called by the interval timer (and once at setup) to beat the
+        heart at the service.
         """
         LOGGER.debug("Heartbeat timer triggered")
-        await self._send_heartbeat_with_retry()
-        self._set_heartbeat_timer()
-
-    def _set_heartbeat_timer(self) -> None:
-        """Set up the next call to the hausnet_heartbeat function."""
-        # noinspection PyTypeChecker
-        async_call_later(self._hass, HEARTBEAT_PERIOD_SECONDS, self.beat_heart)
-        LOGGER.debug(
-            "Heartbeat scheduled in %d seconds",
-            HEARTBEAT_PERIOD_SECONDS
-        )
+        if self._busy.locked():
+            LOGGER.warning("Previous heartbeat still running; skipping beat")
+            return
+        async with self._busy:
+            await self._send_heartbeat_with_retry()
 
     async def init_api_client(self):
-        """ Initialize client using the provided URL and token. """
-        self._api_client = await self._hass.async_add_executor_job(
-            lambda url=self._api_url, token=self._api_token:
-                HeartbeatClient(url, token)
+        """ Initialize client using the provided URL and token, on the
+            shared HASS client session.
+        """
+        self._api_client = HeartbeatClient(
+            async_get_clientsession(self._hass),
+            self._api_url,
+            self._api_token
         )
 
     @staticmethod
@@ -154,13 +219,10 @@ class HeartbeatService:
                 - UNKNOWN_FAILURE:  Failure to connect for an unknown reason
         """
         try:
-            api_client = await hass.async_add_executor_job(
-                lambda c_url=url, c_token=token:
-                    HeartbeatClient(c_url, c_token)
-            )
-            device = await hass.async_add_executor_job(
-                api_client.get_device, device_name
+            api_client = HeartbeatClient(
+                async_get_clientsession(hass), url, token
             )
+            device = await api_client.get_device(device_name)
             if not device:
                 return False, HeartbeatService.DEVICE_NOT_FOUND
         except HeartbeatClientAuthError:
@@ -173,10 +235,21 @@ class HeartbeatService:
 
     # noinspection PyBroadException
     async def _send_heartbeat_with_retry(self):
-        """ Try sending the hausnet_heartbeat, and if that fails, re-initialize
-            the client and retry (HEARBEAT_RETRY_TIMES times).
+        """ Try sending the hausnet_heartbeat, and if that fails, retry
+            (HEARTBEAT_RETRY_TIMES times), backing off exponentially with
+            jitter between attempts. The client (and its pooled HTTP
+            connection) is kept across transient errors -- it is only torn
+            down and rebuilt when the connection itself failed. An
+            authentication failure stops the retries outright: repeating
+            a rejected token is pointless.
         """
         for retry_count in range(0, HEARTBEAT_RETRY_TIMES):
+            if retry_count:
+                base = min(
+                    HEARTBEAT_MAX_BACKOFF,
+                    HEARTBEAT_INITIAL_BACKOFF * 2 ** (retry_count - 1)
+                )
+                await asyncio.sleep(random.uniform(base, base * 2))
             try:
                 if not self._api_client:
                     await self.init_api_client()
@@ -188,11 +261,28 @@ class HeartbeatService:
                     continue
                 if await self._send_heartbeat():
                     return
+            except HeartbeatClientAuthError:
+                LOGGER.error(
+                    "Heartbeat authentication failed; not retrying. "
+                    "Starting reauthorization."
+                )
+                self._entry.async_start_reauth(self._hass)
+                return
+            except HeartbeatClientConnectError:
+                LOGGER.exception(
+                    "Heartbeat connection failed, try %d of %d. "
+                    "Resetting client.",
+                    retry_count + 1, HEARTBEAT_RETRY_TIMES
+                )
+                self._api_client = None
+                self._heartbeat_id = None
+                continue
             except Exception:
                 LOGGER.exception(
-                    f"Heartbeat send failed, try {retry_count + 1} of "
-                    f"{HEARTBEAT_RETRY_TIMES}."
+                    "Heartbeat send failed, try %d of %d.",
+                    retry_count + 1, HEARTBEAT_RETRY_TIMES
                 )
+                self._heartbeat_id = None
                 continue
         LOGGER.error("Heartbeat send failed. Skipping beat.")
 
@@ -200,21 +290,42 @@ class HeartbeatService:
         """ Send a hausnet_heartbeat to reset the hausnet_heartbeat timer for
             a device. Returns False if a heartbeat object could not be found
             at the service, True if the heartbeat was found and sent.
+
+            The heartbeat id is looked up on the first call only -- the
+            device-to-heartbeat mapping does not change in practice, and a
+            failed send clears the cache so a rotated id gets re-fetched.
         """
-        heartbeat = await self._hass.async_add_executor_job(
-            self._api_client.get_heartbeat, self._device_name
-        )
-        if not heartbeat:
-            LOGGER.error(f"No heartbeat found for device: {self._device_name}")
-            return False
-        await self._hass.async_add_executor_job(
-            self._api_client.send_heartbeat, heartbeat['id']
-        )
+        if self._heartbeat_id is None:
+            heartbeat_id = await self._api_client.get_heartbeat_id(
+                self._device_name
+            )
+            if not heartbeat_id:
+                LOGGER.error(
+                    "No heartbeat found for device: %s", self._device_name
+                )
+                return False
+            self._heartbeat_id = heartbeat_id
+        await self._api_client.send_heartbeat(self._heartbeat_id)
         LOGGER.info(
             "Sent a hausnet_heartbeat for: device=%s; heartbeat_id=%d",
             self._device_name,
-            heartbeat['id']
+            self._heartbeat_id
         )
         return True
 
 
+# Connection-verification failure messages, keyed on the service error
+# codes and formatted with the url/device at error time, instead of
+# interpolating all of them on every entry setup.
+_FAILURE_TEMPLATES = {
+    HeartbeatService.CONNECT_FAILED:
+        "Network connection to {url} failed.",
+    HeartbeatService.DEVICE_NOT_FOUND:
+        "Device {device} not found at service",
+    HeartbeatService.AUTH_FAILED:
+        "Authentication token invalid",
+    HeartbeatService.UNKNOWN_FAILURE:
+        "Unknown connection or authentication failure ",
+}
+
+
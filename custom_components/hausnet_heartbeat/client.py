@@ -1,16 +1,18 @@
 """ A thin client for the Heartbeat API. """
 
-from typing import Dict, List, Union, Optional
+import time
+from typing import Any, Dict, List, Optional, Union
 import logging
 
-from urllib.parse import urlparse
-
-import bravado.exception
-from bravado.client import SwaggerClient
-from bravado.requests_client import RequestsClient
+import aiohttp
 
 log = logging.getLogger(__name__)
 
+# How long the name-indexed device list is kept before it is fetched
+# again. Device definitions change rarely, so lookups between beats can
+# reuse the previous download.
+DEVICE_CACHE_SECONDS = 600
+
 
 class HeartbeatClientAuthError(Exception):
     """ Exception when service authentication failed. """
@@ -23,70 +25,103 @@ class HeartbeatClientConnectError(Exception):
 
 
 class HeartbeatClient:
-    """ Encapsulates Heartbeat api_client functionality. """
-
-    def __init__(self, service_url: str, token: str) -> None:
-        """ Create a Swagger API client, load the Swagger definition from the
-            provided service url, and set the authentication token for the
-            domain name in the url.
-
+    """ Encapsulates Heartbeat api_client functionality. Calls the service's
+        REST API directly with aiohttp, on a session provided by the caller
+        (in HASS, the shared client session), so requests run on the event
+        loop and reuse the session's pooled connections.
+    """
+
+    def __init__(
+            self,
+            session: aiohttp.ClientSession,
+            service_url: str,
+            token: str
+    ) -> None:
+        """ Set up the client with the session to make calls on, the
+            service's URL, and the service's authentication token.
+
+            :param session:     The aiohttp session requests are made on.
             :param service_url: The base URL for the service, e.g.
-                                'https://mon.hausnet.io/api', without a trailing
-                                slash.
+                                'https://mon.hausnet.io/api', without a
+                                trailing slash.
             :param token:       The access token provided by the HausNet
                                 service.
-            :raises:            HeartbeatClientConnectError if a connection
-                                could not be made. This includes a missing
-                                Swagger definition.
         """
-        self.swagger_client: Optional[SwaggerClient] = None
-        host = urlparse(service_url).hostname
-        http_client = RequestsClient()
-        http_client.set_api_key(
-            host=host,
-            api_key=f'Token {token}',
-            param_in='header',
-            param_name='Authorization'
-        )
-        self.swagger_client = None
+        self._session = session
+        self._base_url = service_url.rstrip('/')
+        self._headers = {'Authorization': f'Token {token}'}
+        # Name-indexed device cache, refreshed when older than
+        # DEVICE_CACHE_SECONDS.
+        self._devices_by_name: Optional[Dict[str, Dict]] = None
+        self._devices_fetched_at: float = 0.0
+
+    async def _get(self, path: str) -> Any:
+        """ Make a GET call to the given API path, and return the decoded
+            JSON body (or None for an empty body).
+
+            :raises: HeartbeatClientAuthError if the token was rejected;
+                     HeartbeatClientConnectError if a connection could not
+                     be made.
+        """
+        url = f'{self._base_url}{path}'
         try:
-            self.swagger_client = SwaggerClient.from_url(
-                f'{service_url}/swagger.json', http_client=http_client
-            )
-            log.info(f"Connected to Heartbeat client at: url={service_url}")
-        except bravado.exception.HTTPUnauthorized as e:
-            raise HeartbeatClientAuthError from e
-        except Exception as e:
+            async with self._session.get(
+                    url, headers=self._headers
+            ) as response:
+                if response.status in (401, 403):
+                    raise HeartbeatClientAuthError(
+                        f"Authentication failed: url={url}"
+                    )
+                response.raise_for_status()
+                if not await response.read():
+                    return None
+                # content_type=None: don't insist on the JSON content type
+                # header -- the beat endpoint replies with an empty body.
+                return await response.json(content_type=None)
+        except (aiohttp.ClientConnectionError, TimeoutError) as e:
             log.exception(
-                f"Failed to connect to Heartbeat client: url={service_url}"
+                "Failed to connect to Heartbeat service: url=%s", url
             )
             raise HeartbeatClientConnectError from e
 
-    @property
-    def connected(self) -> bool:
-        """ Tell if client has been initialized. """
-        return self.swagger_client is not None
-
-    def list_devices(self) -> List[Dict]:
+    async def list_devices(self) -> List[Dict]:
         """ Get a list of devices belonging to the user associated with the
             auth token.
         """
-        devices = self.swagger_client.devices.devices_list().response().result
-        return devices
+        return await self._get('/devices/')
 
-    def get_device(self, name: str) -> Union[Dict, None]:
-        """ Get a device by name, by iterating through all the devices.
+    async def get_device(self, name: str) -> Union[Dict, None]:
+        """ Get a device by name, from a name-indexed cache of the device
+            list that is refreshed when it grows stale.
 
             TODO: Add an API endpoint that directly fetches the device by name,
-                  instead of having to iterate.
+                  instead of having to download the whole list.
+        """
+        now = time.monotonic()
+        if (
+                self._devices_by_name is None
+                or now - self._devices_fetched_at >= DEVICE_CACHE_SECONDS
+        ):
+            devices = await self.list_devices()
+            self._devices_by_name = {
+                device['name']: device
+                for device in devices if 'name' in device
+            }
+            self._devices_fetched_at = now
+        return self._devices_by_name.get(name)
+
+    async def get_heartbeat_id(self, device_name: str) -> Optional[int]:
+        """ Get the id of a device's hausnet_heartbeat, straight off the
+            device record. Sending a beat only needs the id, so this skips
+            fetching the heartbeat object just to read an id the device
+            already carries.
         """
-        devices = self.list_devices()
-        for device in devices:
-            if 'name' in device and device['name'] == name:
-                return device
-        return None
+        device = await self.get_device(device_name)
+        if not device or not device['heartbeat_id']:
+            return None
+        return device['heartbeat_id']
 
-    def get_heartbeat(self, device_name: str) -> Union[Dict, None]:
+    async def get_heartbeat(self, device_name: str) -> Union[Dict, None]:
         """ Get a device's hausnet_heartbeat.
 
             :return: The hausnet_heartbeat (dynamic) object if a
@@ -94,17 +129,13 @@ class HeartbeatClient:
 
             TODO: Add an API call to do this directly from the device name.
         """
-        device = self.get_device(device_name)
+        device = await self.get_device(device_name)
         if not device or not device['heartbeat_id']:
             return None
-        heartbeat = self.swagger_client.heartbeats.heartbeats_read(
-            id=device['heartbeat_id']
-        ).response().result
-        return heartbeat
-
-    def send_heartbeat(self, heartbeat_id: int):
-        """ Send a hausnet_heartbeat for a specific hausnet_heartbeat definition
-            (or device).
+        return await self._get(f"/heartbeats/{device['heartbeat_id']}/")
+
+    async def send_heartbeat(self, heartbeat_id: int) -> None:
+        """ Send a hausnet_heartbeat for a specific hausnet_heartbeat
+            definition (or device).
         """
-        self.swagger_client.heartbeats.heartbeats_beat_read(id=heartbeat_id).\
-            response()
+        await self._get(f'/heartbeats/{heartbeat_id}/beat/')
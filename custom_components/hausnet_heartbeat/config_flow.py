@@ -1,5 +1,6 @@
 """ Configuration flows. """
 
+import time
 from typing import Any, Optional, Tuple, Dict
 
 import voluptuous as vol
@@ -13,6 +14,21 @@ from . import DOMAIN, HEARTBEAT_URL, HeartbeatService
 
 HEARTBEAT_CONFIG_ID = "heartbeat_config"
 
+# The user-step form schema, compiled once at import. Re-renders layer
+# the previously entered values on top with
+# add_suggested_values_to_schema instead of rebuilding the schema.
+HEARTBEAT_SCHEMA = vol.Schema({
+    vol.Required(CONF_API_KEY): cv.string,
+    vol.Required(CONF_DEVICE): cv.string,
+})
+
+# Recent verify_connection results, keyed on (token, device), so a user
+# resubmitting the same mistyped form within the TTL gets the cached
+# verdict instead of another round-trip to the service. A successful
+# validation drops its entry, since the entry is then consumed anyway.
+_VERIFY_TTL_SECONDS = 10.0
+_verify_cache: Dict[Tuple[str, str], Tuple[float, Tuple[bool, Optional[int]]]] = {}
+
 
 class HeartbeatConfigFlow(ConfigFlow, domain=DOMAIN):
     """ Configure the Heartbeat service. """
@@ -25,8 +41,7 @@ class HeartbeatConfigFlow(ConfigFlow, domain=DOMAIN):
         """ User-driven discovery. """
 
         errors = {}
-        api_key_field = None
-        device_field = None
+        data_schema = HEARTBEAT_SCHEMA
         if user_input is not None:
             success, errors = await self._validate_input(user_input)
             if success:
@@ -35,14 +50,12 @@ class HeartbeatConfigFlow(ConfigFlow, domain=DOMAIN):
                     title='Heartbeat Configuration',
                     data=user_input
                 )
-            api_key_field = user_input[CONF_API_KEY]
-            device_field = user_input[CONF_DEVICE]
+            data_schema = self.add_suggested_values_to_schema(
+                HEARTBEAT_SCHEMA, user_input
+            )
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required(CONF_API_KEY, default=api_key_field): cv.string,
-                vol.Required(CONF_DEVICE, default=device_field): cv.string,
-            }),
+            data_schema=data_schema,
             errors=errors
         )
 
@@ -64,12 +77,21 @@ class HeartbeatConfigFlow(ConfigFlow, domain=DOMAIN):
         """ Validate form input. """
         errors = {}
 
-        success, error_code = await HeartbeatService.verify_connection(
-            self.hass,
-            HEARTBEAT_URL,
-            user_input[CONF_API_KEY],
-            user_input[CONF_DEVICE]
-        )
+        cache_key = (user_input[CONF_API_KEY], user_input[CONF_DEVICE])
+        now = time.monotonic()
+        cached = _verify_cache.get(cache_key)
+        if cached and now - cached[0] < _VERIFY_TTL_SECONDS:
+            success, error_code = cached[1]
+        else:
+            success, error_code = await HeartbeatService.verify_connection(
+                self.hass,
+                HEARTBEAT_URL,
+                user_input[CONF_API_KEY],
+                user_input[CONF_DEVICE]
+            )
+            _verify_cache[cache_key] = (now, (success, error_code))
+        if success:
+            _verify_cache.pop(cache_key, None)
         if error_code == HeartbeatService.CONNECT_FAILED:
             errors['base'] = 'cannot_connect'
         elif error_code == HeartbeatService.AUTH_FAILED:
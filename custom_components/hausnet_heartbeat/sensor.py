@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
+import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import datetime
 import logging
-from typing import Any, Dict, Optional, List
-import pprint
+from typing import Any, Dict, Optional, List, Tuple
 
 import voluptuous as vol
 
@@ -19,54 +21,64 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.const import (
     CONF_ICON,
     CONF_SENSORS,
-    CONF_ID, CONF_NAME, EVENT_STATE_CHANGED, EVENT_HOMEASSISTANT_STARTED,
+    CONF_ID, CONF_NAME, EVENT_HOMEASSISTANT_STARTED,
+    EVENT_HOMEASSISTANT_STOP,
 )
-from homeassistant.core import HomeAssistant, Event
+from homeassistant.core import HomeAssistant, Event, callback
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, \
+    async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
+# Captured once at import: the verbose per-event debug blocks assemble
+# argument tuples (and touch dataclass fields) even when DEBUG is off, so
+# the hot handlers check this flag instead of calling isEnabledFor each
+# time.
+_DEBUG = _LOGGER.isEnabledFor(logging.DEBUG)
 
 CONF_RELATED_ENTITY_ID = "related_entity_id"
 CONF_PULSE_MINUTES = "pulse_minutes"
-DEFAULT_ICON = "mdi.alarm"
+DEFAULT_ICON = "mdi:alarm"
 SCAN_INTERVAL_MINUTES = 1
 
 SIGNAL_HEARTBEAT_UPDATE = "heartbeat_update"
 
+# Schema for one sensor entry. Built once at import so YAML reloads reuse
+# the compiled schema instead of rebuilding it.
+SENSOR_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ID): cv.string,
+        vol.Required(CONF_NAME): cv.string,
+        vol.Required(CONF_RELATED_ENTITY_ID): cv.entity_id,
+        vol.Required(CONF_PULSE_MINUTES): cv.positive_int,
+        vol.Required(CONF_ICON, default=DEFAULT_ICON): cv.icon
+    }
+)
+
 # TODO: Make id & name unique
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Optional(CONF_SENSORS): vol.All(
             cv.ensure_list,
-            [
-                vol.Schema(
-                    {
-                        vol.Required(CONF_ID): cv.string,
-                        vol.Required(CONF_NAME): cv.string,
-                        vol.Required(CONF_RELATED_ENTITY_ID): cv.entity_id,
-                        vol.Required(CONF_PULSE_MINUTES): cv.positive_int,
-                        vol.Required(CONF_ICON, default=DEFAULT_ICON):
-                            cv.icon
-                    }
-                )
-            ]
+            [SENSOR_SCHEMA]
         )
     }
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class PulseState:
     """Data for a missing pulse sensor."""
     # The current state - true => pulse missing, false => pulse present
     pulse_missing: bool
-    # Time by which, if no pulse has been received, the pulse will be
-    # considered missing.
-    receipt_deadline: Optional[datetime.datetime]
+    # Monotonic time (time.monotonic() seconds) by which, if no pulse has
+    # been received, the pulse will be considered missing. Monotonic,
+    # because this is interval math -- wall-clock steps (NTP, DST) must
+    # not make pulses misfire.
+    receipt_deadline: Optional[float]
     # Minutes between expected pulses.
     pulse_minutes: int
     # Related entity that is being monitored.
@@ -75,13 +87,22 @@ class PulseState:
     update_time: Optional[datetime.datetime]
     # Last exception, if any.
     last_exception: Optional[BaseException]
+    # Precomputed expected-pulse interval, derived from pulse_minutes.
+    pulse_seconds: int = field(init=False)
+
+    def __post_init__(self):
+        """Precompute the expected-pulse interval, so deadline updates on
+        the hot event path are a single float addition.
+        """
+        self.pulse_seconds = self.pulse_minutes * 60
 
-    def set_next_deadline(self):
-        """Set the next deadline by adding the number of minutes a pulse is
-        expected in, to the current date/time.
+    def set_next_deadline(self, now: Optional[float] = None) -> None:
+        """Set the next deadline by adding the expected pulse interval to
+        the given monotonic time (or the current one).
         """
-        self.receipt_deadline = datetime.datetime.now() + \
-            datetime.timedelta(minutes=self.pulse_minutes)
+        if now is None:
+            now = time.monotonic()
+        self.receipt_deadline = now + self.pulse_seconds
 
 
 # noinspection PyUnusedLocal
@@ -93,29 +114,35 @@ async def async_setup_platform(
     discovery_info: Optional[Any] = None
 ) -> None:
     """Set up the monitor condition sensors."""
-    entities: List[BinarySensorEntity] = []
-    sensor_registry: Dict[str, PulseState] = {}
-
-    for sensor_config in config[CONF_SENSORS]:
-        pulse_minutes = sensor_config[CONF_PULSE_MINUTES]
-        sensor_id = sensor_config[CONF_ID]
-        related_entity_id = sensor_config[CONF_RELATED_ENTITY_ID]
-        sensor_registry[sensor_id] = PulseState(
+    sensor_configs = config[CONF_SENSORS]
+    # Build the registry and entity list in single passes -- the shape is
+    # fully known from the config, so there is no need to grow them
+    # entry by entry.
+    sensor_registry: Dict[str, PulseState] = {
+        sensor_config[CONF_ID]: PulseState(
             pulse_missing=False,
             receipt_deadline=None,
-            pulse_minutes=pulse_minutes,
-            related_entity_id=related_entity_id,
+            pulse_minutes=sensor_config[CONF_PULSE_MINUTES],
+            # Interned so hot-path comparisons against the entity ids the
+            # core passes around can short-circuit on identity.
+            related_entity_id=sys.intern(
+                sensor_config[CONF_RELATED_ENTITY_ID]
+            ),
             update_time=None,
             last_exception=None
         )
-        _LOGGER.debug("Added sensor to registry: %s", sensor_id)
-        entities.append(PulseMissingSensor(
+        for sensor_config in sensor_configs
+    }
+    entities: List[BinarySensorEntity] = [
+        PulseMissingSensor(
             sensor_config[CONF_ID],
             sensor_config[CONF_NAME],
             sensor_config[CONF_ICON],
-            sensor_registry[sensor_id]
-        ))
-        _LOGGER.debug("Created entity for sensor: %s", sensor_id)
+            sensor_registry[sensor_config[CONF_ID]]
+        )
+        for sensor_config in sensor_configs
+    ]
+    _LOGGER.debug("Created sensors: %s", list(sensor_registry))
     async_add_entities(entities)
     await async_manage_sensor_registry_updates(
         hass,
@@ -128,106 +155,238 @@ async def async_manage_sensor_registry_updates(
     sensor_registry: Dict[str, PulseState]
 ) -> None:
     """Update the registry and create polling."""
-    _pulse_data_lock = asyncio.Lock()
-    _timeout_scheduled = False
+    # No lock is needed around registry/heap access: everything below runs
+    # on the single-threaded event loop and never awaits between related
+    # reads and writes, so each handler is atomic as far as this state is
+    # concerned.
+    _dispatch_pending = False
+    _timer_handle: Optional[asyncio.TimerHandle] = None
+    # The deadline the armed timer was scheduled for, so a new earliest
+    # deadline can be compared against it and the timer rearmed when it
+    # would otherwise fire too late.
+    _scheduled_deadline: Optional[float] = None
+    # Pulses received in the current loop iteration, drained in one batch
+    # on the next call_soon tick. Keyed by sensor id, so repeated events
+    # for the same sensor collapse to one update.
+    _pending_pulses: Dict[str, PulseState] = {}
+
+    # Sensor ids whose state changed since the last dispatch, sent as the
+    # signal payload so listeners only write the affected entities.
+    _changed_ids: set = set()
+
+    def _do_dispatch() -> None:
+        """Fire one dispatcher signal for all updates queued this tick."""
+        nonlocal _dispatch_pending
+        _dispatch_pending = False
+        changed = frozenset(_changed_ids)
+        _changed_ids.clear()
+        async_dispatcher_send(hass, SIGNAL_HEARTBEAT_UPDATE, changed)
+
+    def _schedule_dispatch(changed_ids: List[str]) -> None:
+        """Coalesce dispatcher sends onto the next loop iteration, so a
+        burst of pulse updates in the same tick results in a single
+        entity-state write instead of one per event.
+        """
+        nonlocal _dispatch_pending
+        _changed_ids.update(changed_ids)
+        if _dispatch_pending:
+            return
+        _dispatch_pending = True
+        hass.loop.call_soon(_do_dispatch)
+
+    # Index from a monitored entity's id to the sensors watching it, so an
+    # event can be matched with one dict probe instead of scanning the
+    # whole registry on every state change in the house.
+    entity_index: Dict[str, List[Tuple[str, PulseState]]] = {}
+    for sensor_id, pulse_state in sensor_registry.items():
+        entity_index.setdefault(
+            pulse_state.related_entity_id, []
+        ).append((sensor_id, pulse_state))
+    # Min-heap of (receipt_deadline, seq, sensor_id), so finding the next
+    # deadline is O(1) instead of a registry scan. The monotonically
+    # increasing seq breaks deadline ties, keeping heap comparisons on
+    # floats/ints and off the sensor-id strings. Entries are never
+    # removed when a pulse arrives -- a superseded entry is detected by
+    # comparing it against the sensor's current deadline and dropped
+    # lazily when it surfaces at the top of the heap.
+    deadline_heap: List[Tuple[float, int, str]] = []
+    _deadline_seq = itertools.count()
+
+    def _push_deadline(sensor_id: str, pulse_state: PulseState) -> None:
+        """Record a sensor's (re)computed deadline on the heap."""
+        if pulse_state.receipt_deadline is None:
+            return
+        heapq.heappush(
+            deadline_heap,
+            (pulse_state.receipt_deadline, next(_deadline_seq), sensor_id)
+        )
+
+    def _prune_stale_deadlines() -> None:
+        """Drop superseded entries from the top of the heap."""
+        while deadline_heap:
+            deadline, _seq, sensor_id = deadline_heap[0]
+            if sensor_registry[sensor_id].receipt_deadline == deadline:
+                return
+            heapq.heappop(deadline_heap)
 
     def _handle_missing_pulse(sensor_id: str, pulse_state: PulseState) -> bool:
         """ Called when pulse goes missing. Returns true if the pulse went
         missing since the last time it was received -- i.e. it happened since
         the last time it was updated.
         """
-        _LOGGER.debug(
-            "Handling missing pulse: "
-            "sensor=%s, related_entity_id=%s, current_state=%s",
-            sensor_id,
-            pulse_state.related_entity_id,
-            pulse_state.pulse_missing
-        )
+        if _DEBUG:
+            _LOGGER.debug(
+                "Handling missing pulse: "
+                "sensor=%s, related_entity_id=%s, current_state=%s",
+                sensor_id,
+                pulse_state.related_entity_id,
+                pulse_state.pulse_missing
+            )
         if pulse_state.pulse_missing:
             return False
         pulse_state.pulse_missing = True
-        entity_id = pulse_state.related_entity_id
-        minutes = pulse_state.pulse_minutes
+        return True
+
+    def _notify_missing(
+        missing: List[Tuple[str, PulseState]], now: float
+    ) -> None:
+        """ Create one persistent notification for all the pulses that went
+        missing in this tick -- e.g. after a network outage several expire
+        together, and a notification per sensor would just pile up.
+        """
+        if len(missing) == 1:
+            sensor_id, pulse_state = missing[0]
+            message = (
+                f"No updates received from "
+                f"'{pulse_state.related_entity_id}' in "
+                f"{pulse_state.pulse_minutes} minutes. "
+            )
+            title = f"Pulse missing: {sensor_id}"
+        else:
+            message = "\n".join(
+                f"- '{pulse_state.related_entity_id}' ({sensor_id}): "
+                f"no updates in {pulse_state.pulse_minutes} minutes"
+                for sensor_id, pulse_state in missing
+            )
+            title = f"Pulses missing: {len(missing)} sensors"
         persistent_notification.async_create(
             hass,
-            f"No updates received from '{entity_id}' in {minutes} minutes. ",
-            title=f"Pulse missing: {sensor_id}",
-            notification_id=sensor_id + '.' + str(int(time.time()))
+            message,
+            title=title,
+            notification_id=f"{missing[0][0]}.{int(now)}"
+        )
+
+    def _notify_resumed(
+        resumed: List[Tuple[str, PulseState]], now: float
+    ) -> None:
+        """ Create one persistent notification for all the pulses that
+        resumed in this tick.
+        """
+        if len(resumed) == 1:
+            sensor_id, pulse_state = resumed[0]
+            message = (
+                f"Missing pulse from "
+                f"'{pulse_state.related_entity_id}' resumed. "
+            )
+            title = f"Pulse resumed: {sensor_id}"
+        else:
+            message = "\n".join(
+                f"- '{pulse_state.related_entity_id}' ({sensor_id}): "
+                f"pulse resumed"
+                for sensor_id, pulse_state in resumed
+            )
+            title = f"Pulses resumed: {len(resumed)} sensors"
+        persistent_notification.async_create(
+            hass,
+            message,
+            title=title,
+            notification_id=f"{resumed[0][0]}.{int(now)}"
         )
-        return True
 
-    def _handle_pulse_event(sensor_id: str, pulse_state: PulseState) -> bool:
+    def _handle_pulse_event(
+        sensor_id: str, pulse_state: PulseState, now: float
+    ) -> bool:
         """ Update a pulse's state when a pulse event is received. Returns
         True if the state goes from missing to present.
         """
-        _LOGGER.debug(
-            "Handling pulse event received: entity=%s; current_state=%s",
-            pulse_state.related_entity_id,
-            pulse_state.pulse_missing
-        )
+        if _DEBUG:
+            _LOGGER.debug(
+                "Handling pulse event received: entity=%s; current_state=%s",
+                pulse_state.related_entity_id,
+                pulse_state.pulse_missing
+            )
         state_changed = pulse_state.pulse_missing
         pulse_state.pulse_missing = False
-        now = datetime.datetime.now()
-        pulse_state.update_time = now
+        pulse_state.update_time = datetime.datetime.now()
         pulse_state.last_exception = None
-        pulse_state.set_next_deadline()
-        entity_id = pulse_state.related_entity_id
-        if state_changed:
-            persistent_notification.async_create(
-                hass,
-                f"Missing pulse from '{entity_id}' resumed. ",
-                title=f"Pulse resumed: {sensor_id}",
-                notification_id=sensor_id + str(int(time.time()))
-            )
+        pulse_state.set_next_deadline(now)
+        _push_deadline(sensor_id, pulse_state)
         return state_changed
 
-    async def _set_next_deadline():
-        """If a timeout has not been scheduled, schedule one for the closest
-        receipt_deadline in the future. Does not schedule a timeout if all the
-        pulses have gone missing.
+    @callback
+    def _set_next_deadline() -> None:
+        """Schedule a timeout for the closest receipt_deadline on the heap.
+        If a timer is already armed for that deadline (or an earlier one)
+        it is left alone; if the earliest deadline moved up, the armed
+        timer would fire too late, so it is cancelled and rearmed. Does
+        not schedule a timeout if all the pulses have gone missing (in
+        which case the heap is empty).
 
         Note that the callback timer's resolution is seconds, so 1 is added to
         the timeout to avoid timeout times of zero.
         """
-        async with _pulse_data_lock:
-            nonlocal _timeout_scheduled
-            if _timeout_scheduled:
+        nonlocal _timer_handle, _scheduled_deadline
+        _prune_stale_deadlines()
+        if not deadline_heap:
+            _LOGGER.debug("No next timeout found")
+            return
+        next_deadline = deadline_heap[0][0]
+        if _timer_handle is not None:
+            if next_deadline >= _scheduled_deadline:
                 return
-            next_timeout: Optional[datetime.datetime] = None
-            now = datetime.datetime.now()
-            for sensor_id, pulse_state in sensor_registry.items():
-                if pulse_state.receipt_deadline < now:
-                    continue
-                if next_timeout is None:
-                    next_timeout = pulse_state.receipt_deadline
-                    continue
-                if pulse_state.receipt_deadline < next_timeout:
-                    next_timeout = pulse_state.receipt_deadline
-            if next_timeout is None:
-                _LOGGER.debug("No next timeout found")
-                return
-            _LOGGER.debug(
-                "Setting next pulse timeout: scheduled=%s",
-                next_timeout
-            )
-            _timeout_scheduled = True
-        next_timeout_seconds = int((next_timeout - now).total_seconds()) + 1
-        async_call_later(hass, next_timeout_seconds, _pulse_timeout)
+            _timer_handle.cancel()
+        now = time.monotonic()
+        _LOGGER.debug(
+            "Setting next pulse timeout: scheduled=%s",
+            next_deadline
+        )
+        _scheduled_deadline = next_deadline
+        # Clamped to at least a second, so a deadline that slipped into
+        # the past can't schedule a zero/negative timeout that busy-loops.
+        next_timeout_seconds = max(1, int(next_deadline - now) + 1)
+        # Plain call_at + TimerHandle instead of async_call_later: no
+        # per-tick listener object, and the handle can be cancelled
+        # directly on shutdown.
+        _timer_handle = hass.loop.call_at(
+            hass.loop.time() + next_timeout_seconds, _on_pulse_timer
+        )
+
+    def _on_pulse_timer() -> None:
+        """Timer callback; schedules the timeout coroutine."""
+        nonlocal _timer_handle, _scheduled_deadline
+        _timer_handle = None
+        _scheduled_deadline = None
+        # Eager start: the timeout handler runs synchronously from the
+        # timer callback, instead of being queued for a later loop pass.
+        hass.async_create_task(_pulse_timeout(None), eager_start=True)
 
     # noinspection PyUnusedLocal
     # timestamp ignored
-    async def _pulse_timeout(timestamp: datetime.datetime) -> None:
-        """Given the current time, examines each of the sensors, and, if its
-        receipt_deadline is in the past, handles it as a missing pulse. Then,
-        sets the next timout.
+    async def _pulse_timeout(timestamp: Optional[datetime.datetime]) -> None:
+        """Pops every deadline on the heap that is in the past, and handles
+        each as a missing pulse, skipping entries superseded by a received
+        pulse. Then, sets the next timeout.
         """
         _LOGGER.debug("Pulse timeout!")
-        state_changed = False
-        async with _pulse_data_lock:
-            nonlocal _timeout_scheduled
-            _timeout_scheduled = False
-            now = datetime.datetime.now()
-            for sensor_id, pulse_state in sensor_registry.items():
+        missing: List[Tuple[str, PulseState]] = []
+        now = time.monotonic()
+        while deadline_heap and deadline_heap[0][0] <= now:
+            deadline, _seq, sensor_id = heapq.heappop(deadline_heap)
+            pulse_state = sensor_registry[sensor_id]
+            if pulse_state.receipt_deadline != deadline:
+                # Superseded by a pulse received after the push.
+                continue
+            if _DEBUG:
                 _LOGGER.debug(
                     "State: sensor=%s; entity=%s, now=%s; deadline=%s",
                     sensor_id,
@@ -235,14 +394,12 @@ async def async_manage_sensor_registry_updates(
                     now,
                     pulse_state.receipt_deadline
                 )
-                if pulse_state.receipt_deadline < now:
-                    state_changed |= _handle_missing_pulse(
-                        sensor_id,
-                        pulse_state
-                    )
-        if state_changed:
-            async_dispatcher_send(hass, SIGNAL_HEARTBEAT_UPDATE)
-        await _set_next_deadline()
+            if _handle_missing_pulse(sensor_id, pulse_state):
+                missing.append((sensor_id, pulse_state))
+        if missing:
+            _notify_missing(missing, now)
+            _schedule_dispatch([sensor_id for sensor_id, _ in missing])
+        _set_next_deadline()
 
     async def _event_to_pulse(event: Event):
         """Event listener, that, when the event's entity corresponds to one
@@ -251,48 +408,67 @@ async def async_manage_sensor_registry_updates(
         have gone missing, and the pulse timout has to be restarted.
         """
 
-        _LOGGER.debug("Event listener triggered!")
-        pp = pprint.PrettyPrinter()
-        pp.pprint(event)
-
-        state_changed: bool = False
-        async with _pulse_data_lock:
-            for sensor_id, sensor_data in sensor_registry.items():
-                _LOGGER.debug(
-                    "Matching event: related_entity_id=%s; event_entity_id=%s",
-                    sensor_data.related_entity_id,
-                    event.data['entity_id']
-                )
-                if sensor_data.related_entity_id == event.data['entity_id']:
-                    state_changed |= _handle_pulse_event(sensor_id, sensor_data)
-                    _LOGGER.debug(
-                        "Pulse received: entity_id=%s; state_changed=%s",
-                        event.data['entity_id'],
-                        state_changed
-                    )
-        if state_changed:
-            async_dispatcher_send(hass, SIGNAL_HEARTBEAT_UPDATE)
-        await _set_next_deadline()
+        if _DEBUG:
+            _LOGGER.debug("Event listener triggered: event=%r", event)
+        entity_id = event.data['entity_id']
+        matched_sensors = entity_index.get(entity_id)
+        if not matched_sensors:
+            return
+        if not _pending_pulses:
+            hass.loop.call_soon(_drain_pending_pulses)
+        for sensor_id, sensor_data in matched_sensors:
+            _pending_pulses[sensor_id] = sensor_data
+        if _DEBUG:
+            _LOGGER.debug("Pulse queued: entity_id=%s", entity_id)
+
+    def _drain_pending_pulses() -> None:
+        """Apply all pulses collected in the current loop iteration in one
+        go. A burst of state changes for the same sensors is thereby
+        collapsed into a single update and dispatch cycle.
+        """
+        resumed: List[Tuple[str, PulseState]] = []
+        now = time.monotonic()
+        for sensor_id, sensor_data in _pending_pulses.items():
+            if _handle_pulse_event(sensor_id, sensor_data, now):
+                resumed.append((sensor_id, sensor_data))
+        _pending_pulses.clear()
+        if resumed:
+            _notify_resumed(resumed, now)
+            _schedule_dispatch([sensor_id for sensor_id, _ in resumed])
+        _set_next_deadline()
 
     # For event_time, passed in by HASS, but not used.
     # noinspection PyUnusedLocal
     async def _start_pulse_monitor(event_time: datetime.datetime):
         """Start monitoring pulses, and set up the first pulse deadline."""
+        now = time.monotonic()
         for sensor_id, pulse_state in sensor_registry.items():
-            pulse_state.set_next_deadline()
-        remove_listener = hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
+            pulse_state.set_next_deadline(now)
+            _push_deadline(sensor_id, pulse_state)
+        # Subscribe per entity rather than to the state_changed firehose;
+        # the helper keys its dispatch on entity id, so events for
+        # unmonitored entities never reach this platform at all.
+        async_track_state_change_event(
+            hass,
+            list(entity_index),
             _event_to_pulse
         )
-        # TODO: Remove
         _LOGGER.debug("Event listener installed!")
-        pp = pprint.PrettyPrinter()
-        pp.pprint(remove_listener)
-
-        await _set_next_deadline()
+        _set_next_deadline()
 
-    # Start working once HASS is up.
+    # noinspection PyUnusedLocal
+    # (for event - unused)
+    @callback
+    def _stop_pulse_monitor(event: Event) -> None:
+        """Cancel the pending pulse timer on HASS shutdown."""
+        nonlocal _timer_handle
+        if _timer_handle:
+            _timer_handle.cancel()
+            _timer_handle = None
+
+    # Start working once HASS is up, and clean the timer up on shutdown.
     hass.bus.async_listen(EVENT_HOMEASSISTANT_STARTED, _start_pulse_monitor)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _stop_pulse_monitor)
 
 
 class PulseMissingSensor(BinarySensorEntity):
@@ -314,6 +490,29 @@ class PulseMissingSensor(BinarySensorEntity):
         self._pulse_state: PulseState = pulse_state
         self._icon: str = icon
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to pulse state updates. The bound state-write callback
+        is registered once here, rather than method-bound per dispatch.
+        """
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_HEARTBEAT_UPDATE,
+                self._handle_pulse_update
+            )
+        )
+
+    @callback
+    def _handle_pulse_update(self, changed_ids: frozenset) -> None:
+        """Write state only when this sensor is in the changed batch."""
+        if self._unique_id in changed_ids:
+            self.async_write_ha_state()
+
+    @property
+    def is_on(self) -> bool:
+        """Return true when the monitored entity's pulse has gone missing."""
+        return self._pulse_state.pulse_missing
+
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
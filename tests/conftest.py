@@ -5,6 +5,10 @@
 import pytest
 from unittest.mock import patch
 
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.hausnet_heartbeat.client import HeartbeatClient
+
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 TEST_MODULE = "custom_components.hausnet_heartbeat"
@@ -36,6 +40,17 @@ def skip_notifications_fixture():
         yield
 
 
+@pytest.fixture(name="heartbeat_client")
+def heartbeat_client_fixture(hass, aioclient_mock):
+    """ A HeartbeatClient on the HASS test session, pointed at the fake
+        service URL the client tests mock. Depends on aioclient_mock so
+        the session is created after the mock is installed.
+    """
+    return HeartbeatClient(
+        async_get_clientsession(hass), 'http://fakeurl', 'some-token'
+    )
+
+
 @pytest.fixture(name="verified_connection")
 def verified_connection_fixture():
     """ Blanket verification of the connection. """
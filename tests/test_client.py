@@ -1,86 +1,55 @@
 """ Test the client against service mocks. """
 
-import unittest.mock as mock
+SERVICE_URL = 'http://fakeurl'
 
-import custom_components.hausnet_heartbeat.client as hbc
-from bravado.testing.response_mocks import BravadoResponseMock
+DEVICES = [
+    {'id': 1, 'name': 'device_A', 'heartbeat_id': 1},
+    {'id': 2, 'name': 'device_B', 'heartbeat_id': None},
+    {'id': 3, 'name': 'device_C', 'heartbeat_id': 2},
+]
+DEVICE_NAMES = frozenset(device['name'] for device in DEVICES)
 
 
-def test_devices_can_be_listed():
+async def test_devices_can_be_listed(heartbeat_client, aioclient_mock):
     """Test that devices can be listed"""
-    devices = [
-        {'id': 1, 'name': 'device_A', 'heartbeat_id': 1},
-        {'id': 2, 'name': 'device_B', 'heartbeat_id': None},
-        {'id': 3, 'name': 'device_C', 'heartbeat_id': 2},
-    ]
-    mock_client = mock.MagicMock(name='Mock Swagger Client')
-    with mock.patch.object(
-        hbc.SwaggerClient, 'from_url', return_value=mock_client
-    ):
-        heartbeat_client = hbc.HeartbeatClient(
-            service_url='http://fakeurl', token='some-token'
-        )
-        mock_client.devices.devices_list().response.return_value = \
-            BravadoResponseMock(result=devices)
-        devices = heartbeat_client.list_devices()
+    aioclient_mock.get(f'{SERVICE_URL}/devices/', json=DEVICES)
+    devices = await heartbeat_client.list_devices()
     assert len(devices) == 3
 
     for device in devices:
-        assert device['name'] in ['device_A', 'device_B', 'device_C']
+        assert device['name'] in DEVICE_NAMES
         if device['name'] == 'device_B':
             assert device['heartbeat_id'] is None
         else:
             assert device['heartbeat_id'] is not None
 
 
-def test_get_device():
+async def test_get_device(heartbeat_client, aioclient_mock):
     """Test that a specific device can be retrieved."""
-    devices = [
-        {'id': 1, 'name': 'device_A', 'heartbeat_id': 1},
-        {'id': 2, 'name': 'device_B', 'heartbeat_id': None},
-        {'id': 3, 'name': 'device_C', 'heartbeat_id': 2},
-    ]
-    mock_client = mock.MagicMock(name='Mock Swagger Client')
-    with mock.patch.object(
-            hbc.SwaggerClient, 'from_url', return_value=mock_client
-    ):
-        heartbeat_client = hbc.HeartbeatClient(
-            service_url='http://fakeurl', token='some-token'
-        )
-        mock_client.devices.devices_list().response.return_value = \
-            BravadoResponseMock(result=devices)
-        device = heartbeat_client.get_device('device_C')
+    aioclient_mock.get(f'{SERVICE_URL}/devices/', json=DEVICES)
+    device = await heartbeat_client.get_device('device_C')
     assert device['name'] == 'device_C'
 
 
-def test_heartbeat_spec_is_returned() -> None:
+async def test_heartbeat_spec_is_returned(
+        heartbeat_client, aioclient_mock
+) -> None:
     """ Test that a full hausnet_heartbeat spec is returned, given the device
         name.
     """
-    devices = [
-        {'id': 1, 'name': 'device_A', 'heartbeat_id': 1},
-        {'id': 2, 'name': 'device_B', 'heartbeat_id': None},
-        {'id': 3, 'name': 'device_C', 'heartbeat_id': 2},
-    ]
     heartbeat_specs = [
         {'id': 1, 'period_seconds': 15},
         {'id': 2, 'period_seconds': 15},
     ]
-    mock_client = mock.MagicMock(name='Mock Swagger Client')
-    with mock.patch.object(
-            hbc.SwaggerClient, 'from_url', return_value=mock_client
-    ):
-        heartbeat_client = hbc.HeartbeatClient(
-            service_url='http://fakeurl', token='some-token'
-        )
-        mock_client.devices.devices_list().response.return_value = \
-            BravadoResponseMock(result=devices)
-        mock_client.heartbeats.heartbeats_read().response.side_effect = [
-            BravadoResponseMock(result=heartbeat_specs[0]),
-            BravadoResponseMock(result=heartbeat_specs[1]),
-        ]
-        heartbeat_A = heartbeat_client.get_heartbeat('device_A')
-        heartbeat_B = heartbeat_client.get_heartbeat('device_B')
+    aioclient_mock.get(f'{SERVICE_URL}/devices/', json=DEVICES)
+    aioclient_mock.get(
+        f'{SERVICE_URL}/heartbeats/1/', json=heartbeat_specs[0]
+    )
+    aioclient_mock.get(
+        f'{SERVICE_URL}/heartbeats/2/', json=heartbeat_specs[1]
+    )
+    heartbeat_A = await heartbeat_client.get_heartbeat('device_A')
+    heartbeat_B = await heartbeat_client.get_heartbeat('device_B')
     assert heartbeat_A is not None
     assert heartbeat_A['period_seconds'] == 15
     assert heartbeat_B is None